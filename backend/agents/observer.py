@@ -28,7 +28,7 @@ def _clamp(value: float, min_v: float = 0.0, max_v: float = 1.0) -> float:
     return max(min_v, min(value, max_v))
 
 
-@dataclass
+@dataclass(slots=True)
 class EngagementState:
     """Internal cognitive/engagement state for a child session.
     Adapted from IBLM_v2 MentalState."""
@@ -11,7 +11,7 @@ Spec logic (MVP if-this-then-that):
       recommend("same_topic_simplified")
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 
 from backend.database.sqlite_store import SQLiteStore
 from backend.database.vector_store import VectorStore
@@ -90,10 +90,6 @@ class RecommenderAgent:
                 "reason": str
             }
         """
-        completed = self.db.get_completed_topics(child_id)
-        topic_scores = self.db.get_topic_engagement(child_id)
-        top_interests = self.vector_store.get_top_interests(child_id)
-
         # Track items served for anti-echo-chamber (ported from IBLMContext.tsx)
         count = self._items_served.get(child_id, 0) + 1
         self._items_served[child_id] = count
@@ -107,6 +103,8 @@ class RecommenderAgent:
                 "reason": "Low engagement detected. Simplifying current topic.",
             }
 
+        completed = set(self.db.get_completed_topics(child_id))
+
         # ─── Spec Rule: Completed topic + high engagement → advance ───
         if current_topic in completed and engagement_score > 70:
             graph_entry = TOPIC_GRAPH.get(current_topic, {})
@@ -122,6 +120,10 @@ class RecommenderAgent:
                             "reason": f"High engagement on {current_topic}. Advancing to related topic.",
                         }
 
+        # Interests are only needed by the branches below; skip the vector
+        # store query when one of the spec rules above already decided.
+        top_interests = self.vector_store.get_top_interests(child_id)
+
         # ─── Anti-Echo Chamber: Every 4th item is a challenge (from IBLMContext.tsx) ───
         if count % 4 == 0:
             challenge_topic = self._find_challenge_topic(completed, top_interests)
@@ -165,12 +167,11 @@ class RecommenderAgent:
         }
 
     def _find_challenge_topic(
-        self, completed: List[str], interests: List[Dict]
+        self, completed: Set[str], interests: List[Dict]
     ) -> Optional[str]:
         """Find a topic the child hasn't explored yet for growth injection."""
-        familiar_topics = set(completed)
         interest_topics = {i["topic"] for i in interests}
-        all_known = familiar_topics | interest_topics
+        all_known = completed | interest_topics
 
         for topic in TOPIC_GRAPH:
             if topic not in all_known:
@@ -10,21 +10,29 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
+
+def _env_bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in _TRUTHY
+
+
 BASE_DIR = Path(__file__).resolve().parent.parent
-DATA_DIR = BASE_DIR / "data"
-DATA_DIR.mkdir(exist_ok=True)
+DATA_DIR = BASE_DIR / "data"  # created on first use by the stores
 
 # Ollama
 OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.2:3b")
+HEALTH_CACHE_TTL_SEC = 10  # how long GET / reuses the last Ollama health probe
 
 # Server
 BACKEND_PORT = int(os.getenv("BACKEND_PORT", "8000"))
-DEBUG = os.getenv("DEBUG", "true").lower() == "true"
+DEBUG = _env_bool("DEBUG", "true")
 
 # Database
 DATABASE_PATH = os.getenv("DATABASE_PATH", str(DATA_DIR / "kidos.db"))
 CHROMA_PATH = os.getenv("CHROMA_PATH", str(DATA_DIR / "chroma"))
+SQLITE_MMAP_SIZE = 64 * 1024 * 1024  # bytes of the DB file read via mmap
 
 # Agent Thresholds (from spec)
 ENGAGEMENT_LOW_THRESHOLD = 40
@@ -45,3 +45,11 @@ CREATE TABLE IF NOT EXISTS recommendations (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (child_id) REFERENCES child_profiles(child_id)
 );
+
+-- Lookup Indexes (per-child history and interaction joins)
+CREATE INDEX IF NOT EXISTS idx_sessions_child_start
+    ON sessions(child_id, start_time);
+CREATE INDEX IF NOT EXISTS idx_interactions_session
+    ON content_interactions(session_id);
+CREATE INDEX IF NOT EXISTS idx_recommendations_child_created
+    ON recommendations(child_id, created_at);
@@ -8,15 +8,14 @@ Uses raw SQLite for MVP simplicity (no ORM overhead).
 import sqlite3
 import json
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Optional, Dict, List, Any
 
-from backend.config import DATABASE_PATH
+from backend.config import DATABASE_PATH, SQLITE_MMAP_SIZE
 
 
-def _get_schema_path() -> str:
-    return str(Path(__file__).parent / "schema.sql")
+SCHEMA_PATH = Path(__file__).resolve().parent / "schema.sql"
 
 
 class SQLiteStore:
@@ -30,15 +29,15 @@ class SQLiteStore:
     def _get_conn(self) -> sqlite3.Connection:
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
         return conn
 
     def _init_db(self):
-        schema_path = _get_schema_path()
-        with open(schema_path, "r") as f:
-            schema_sql = f.read()
+        schema_sql = SCHEMA_PATH.read_text()
         conn = self._get_conn()
+        # WAL is persistent in the database file, so it only needs setting once
+        conn.execute("PRAGMA journal_mode=WAL")
         conn.executescript(schema_sql)
         conn.commit()
         conn.close()
@@ -120,12 +119,18 @@ class SQLiteStore:
     def log_interaction(
         self, session_id: str, topic: str, content_type: str, engagement_score: int, completed: bool
     ):
+        self.log_interactions(session_id, [topic], content_type, engagement_score, completed)
+
+    def log_interactions(
+        self, session_id: str, topics: List[str], content_type: str, engagement_score: int, completed: bool
+    ):
+        """Log the same outcome for several topics in a single transaction."""
         conn = self._get_conn()
-        conn.execute(
+        conn.executemany(
             """INSERT INTO content_interactions 
                (session_id, content_topic, content_type, engagement_score, completed)
                VALUES (?, ?, ?, ?, ?)""",
-            (session_id, topic, content_type, engagement_score, completed),
+            [(session_id, topic, content_type, engagement_score, completed) for topic in topics],
         )
         conn.commit()
         conn.close()
@@ -196,12 +201,9 @@ class SQLiteStore:
             return 0
 
         streak = 1
-        days = [r["day"] for r in rows]
+        days = [date.fromisoformat(r["day"]) for r in rows]
         for i in range(1, len(days)):
-            from datetime import timedelta
-            d1 = datetime.strptime(days[i - 1], "%Y-%m-%d")
-            d2 = datetime.strptime(days[i], "%Y-%m-%d")
-            if (d1 - d2).days == 1:
+            if (days[i - 1] - days[i]).days == 1:
                 streak += 1
             else:
                 break
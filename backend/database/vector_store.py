@@ -7,6 +7,8 @@ Uses a simple hash-based embedding to avoid downloading large models.
 """
 
 import hashlib
+import heapq
+import numpy as np
 import chromadb
 import chromadb.utils.embedding_functions as ef
 from typing import List, Dict, Any, Optional
@@ -23,18 +25,18 @@ class SimpleHashEmbedding(ef.EmbeddingFunction):
         return "simple_hash_128d"
 
     def __call__(self, input: List[str]) -> List[List[float]]:
-        results = []
-        for text in input:
-            h = hashlib.sha256(text.encode()).hexdigest()
-            # Convert hex digest to 128 floats in [-1, 1]
-            vec = []
-            for i in range(0, min(len(h), 64), 1):
-                val = (int(h[i], 16) - 7.5) / 7.5
-                vec.append(val)
-            # Pad to 128 dims
-            vec = (vec * 4)[:128]
-            results.append(vec)
-        return results
+        # Hash every text up front, then convert the whole batch at once
+        digests = np.frombuffer(
+            b"".join(hashlib.sha256(text.encode()).digest() for text in input),
+            dtype=np.uint8,
+        ).reshape(len(input), 32)
+        # Split each byte into its two hex nibbles → 64 floats in [-1, 1]
+        nibbles = np.empty((len(input), 64), dtype=np.float64)
+        nibbles[:, 0::2] = digests >> 4
+        nibbles[:, 1::2] = digests & 0x0F
+        vecs = (nibbles - 7.5) / 7.5
+        # Pad to 128 dims
+        return np.tile(vecs, 2).tolist()
 
 
 class VectorStore:
@@ -62,11 +64,12 @@ class VectorStore:
         metadata: Optional[Dict[str, Any]] = None,
     ):
         """Store a behavioral observation as an embedding."""
-        doc_id = f"{child_id}_{behavior_type}_{datetime.now().timestamp()}"
+        now = datetime.now()
+        doc_id = f"{child_id}_{behavior_type}_{now.timestamp()}"
         meta = {
             "child_id": child_id,
             "behavior_type": behavior_type,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             **(metadata or {}),
         }
         self.behaviors.add(
@@ -99,29 +102,27 @@ class VectorStore:
 
     def store_topic_interest(self, child_id: str, topic: str, engagement_score: int):
         """Track topic engagement as a searchable embedding."""
-        doc_id = f"{child_id}_topic_{topic}"
-        try:
-            self.topics.update(
-                ids=[doc_id],
-                documents=[f"Child engaged with {topic} at score {engagement_score}"],
-                metadatas=[{
+        self.store_topic_interests(child_id, [topic], engagement_score)
+
+    def store_topic_interests(self, child_id: str, topics: List[str], engagement_score: int):
+        """Track engagement for several topics in one embedding batch."""
+        topics = list(dict.fromkeys(topics))  # upsert rejects duplicate ids
+        if not topics:
+            return
+        updated_at = datetime.now().isoformat()
+        self.topics.upsert(
+            ids=[f"{child_id}_topic_{topic}" for topic in topics],
+            documents=[f"Child engaged with {topic} at score {engagement_score}" for topic in topics],
+            metadatas=[
+                {
                     "child_id": child_id,
                     "topic": topic,
                     "engagement_score": engagement_score,
-                    "updated_at": datetime.now().isoformat(),
-                }],
-            )
-        except Exception:
-            self.topics.add(
-                ids=[doc_id],
-                documents=[f"Child engaged with {topic} at score {engagement_score}"],
-                metadatas=[{
-                    "child_id": child_id,
-                    "topic": topic,
-                    "engagement_score": engagement_score,
-                    "updated_at": datetime.now().isoformat(),
-                }],
-            )
+                    "updated_at": updated_at,
+                }
+                for topic in topics
+            ],
+        )
 
     def get_top_interests(self, child_id: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """Get child's top topic interests by engagement score."""
@@ -131,12 +132,11 @@ class VectorStore:
         if not results["ids"]:
             return []
 
-        interests = [
+        interests = (
             {"topic": m["topic"], "engagement_score": m["engagement_score"]}
             for m in results["metadatas"]
-        ]
-        interests.sort(key=lambda x: x["engagement_score"], reverse=True)
-        return interests[:top_k]
+        )
+        return heapq.nlargest(top_k, interests, key=lambda x: x["engagement_score"])
 
     def find_similar_topics(self, query: str, top_k: int = 3) -> List[str]:
         """Find topics similar to a given query across all children."""
@@ -9,12 +9,12 @@ import json
 import asyncio
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import BackgroundTasks, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 
-from backend.config import BACKEND_PORT, DEBUG
+from backend.config import BACKEND_PORT, DEBUG, HEALTH_CACHE_TTL_SEC
 from backend.schemas import (
     TelemetryRequest,
     TelemetryResponse,
@@ -47,6 +47,10 @@ recommender = RecommenderAgent(db=db, vector_store=vector_store)
 
 # Session tracking (in-memory for MVP)
 active_sessions: dict = {}  # session_id → {child_id, start_time, topics, ...}
+latest_engagement: dict = {}  # child_id → most recent engagement_score from telemetry
+
+# Final SSE frame of every /generate stream (constant, so encoded once)
+STREAM_COMPLETE_DATA = json.dumps({"token": "", "complete": True})
 
 
 @asynccontextmanager
@@ -56,14 +60,18 @@ async def lifespan(app: FastAPI):
     status = health["status"]
     model = health["target_model"]
     available = health["target_available"]
-    print(f"\n🧠 KidOS Agentic MVP Starting...")
-    print(f"   Ollama: {status}")
-    print(f"   Model: {model} ({'✅ available' if available else '❌ not found'})")
+    # Emit the banner as one write so it isn't interleaved with server logs
+    lines = [
+        "\n🧠 KidOS Agentic MVP Starting...",
+        f"   Ollama: {status}",
+        f"   Model: {model} ({'✅ available' if available else '❌ not found'})",
+    ]
     if status == "offline":
-        print(f"   ⚠️  Ollama offline. Teaching Agent will use mock responses.")
-        print(f"   💡 Install: https://ollama.com → then run: ollama pull {model}")
-    print(f"   Database: {db.db_path}")
-    print(f"   API Docs: http://localhost:{BACKEND_PORT}/docs\n")
+        lines.append("   ⚠️  Ollama offline. Teaching Agent will use mock responses.")
+        lines.append(f"   💡 Install: https://ollama.com → then run: ollama pull {model}")
+    lines.append(f"   Database: {db.db_path}")
+    lines.append(f"   API Docs: http://localhost:{BACKEND_PORT}/docs\n")
+    print("\n".join(lines))
     yield
     print("\n🛑 KidOS shutting down...\n")
 
@@ -88,7 +96,7 @@ app.add_middleware(
 
 @app.get("/")
 async def root():
-    health = await ollama_client.check_health()
+    health = await ollama_client.check_health(max_age_sec=HEALTH_CACHE_TTL_SEC)
     return {
         "service": "KidOS Agentic AI",
         "version": "0.1.0-mvp",
@@ -100,7 +108,7 @@ async def root():
 # ─── 1. POST /api/v1/telemetry ───
 
 @app.post("/api/v1/telemetry", response_model=TelemetryResponse)
-async def telemetry(req: TelemetryRequest):
+async def telemetry(req: TelemetryRequest, background_tasks: BackgroundTasks):
     """Send user interaction data → get engagement assessment + routing decision."""
 
     # Step 1: Observer analyzes telemetry
@@ -124,8 +132,11 @@ async def telemetry(req: TelemetryRequest):
         academic_tier=academic_tier,
     )
 
-    # Step 3: Log interaction to vector store
-    vector_store.store_behavior(
+    latest_engagement[req.child_id] = observation["engagement_score"]
+
+    # Step 3: Log interaction to vector store (after the response is sent)
+    background_tasks.add_task(
+        vector_store.store_behavior,
         child_id=req.child_id,
         behavior_type="telemetry",
         description=f"engagement:{observation['engagement_score']} mood:{observation['mood']} frustration:{observation['frustration_level']}",
@@ -163,10 +174,7 @@ async def generate(req: GenerateRequest):
                 "event": "token",
                 "data": json.dumps({"token": token, "complete": False}),
             }
-        yield {
-            "event": "token",
-            "data": json.dumps({"token": "", "complete": True}),
-        }
+        yield {"event": "token", "data": STREAM_COMPLETE_DATA}
 
     return EventSourceResponse(event_stream())
 
@@ -177,11 +185,13 @@ async def generate(req: GenerateRequest):
 async def recommend(req: RecommendRequest):
     """Get next content recommendation."""
 
-    # Get latest engagement score from vector store
-    behaviors = vector_store.query_behaviors(req.child_id, "engagement", top_k=1)
-    last_engagement = 50
-    if behaviors:
-        last_engagement = behaviors[0].get("metadata", {}).get("engagement_score", 50)
+    # Latest engagement score seen by this process; fall back to vector store
+    last_engagement = latest_engagement.get(req.child_id)
+    if last_engagement is None:
+        behaviors = vector_store.query_behaviors(req.child_id, "engagement", top_k=1)
+        last_engagement = 50
+        if behaviors:
+            last_engagement = behaviors[0].get("metadata", {}).get("engagement_score", 50)
 
     result = recommender.suggest(
         child_id=req.child_id,
@@ -248,15 +258,14 @@ async def session_end(req: SessionEndRequest):
     # Log topic interactions
     session_info = active_sessions.pop(req.session_id, {})
     child_id = session_info.get("child_id", "")
-    for topic in req.topics_covered:
-        db.log_interaction(
-            session_id=req.session_id,
-            topic=topic,
-            content_type="lesson",
-            engagement_score=req.final_engagement_score,
-            completed=req.completion_rate > 0.5,
-        )
-        vector_store.store_topic_interest(child_id, topic, req.final_engagement_score)
+    db.log_interactions(
+        session_id=req.session_id,
+        topics=req.topics_covered,
+        content_type="lesson",
+        engagement_score=req.final_engagement_score,
+        completed=req.completion_rate > 0.5,
+    )
+    vector_store.store_topic_interests(child_id, req.topics_covered, req.final_engagement_score)
 
     # Clean up observer state
     observer.clear_session(req.session_id)
@@ -8,6 +8,7 @@ Adapted from IBLM proxy's multi-provider pattern.
 
 import httpx
 import json
+import time
 from typing import AsyncGenerator, Optional, List, Dict, Any
 
 from backend.config import OLLAMA_HOST, OLLAMA_MODEL
@@ -20,9 +21,21 @@ class OllamaClient:
         self.host = host.rstrip("/")
         self.model = model
         self._available_models: List[str] = []
+        self._last_health: Optional[Dict[str, Any]] = None
+        self._last_health_at = 0.0
 
-    async def check_health(self) -> Dict[str, Any]:
-        """Check if Ollama is running and which models are available."""
+    async def check_health(self, max_age_sec: float = 0.0) -> Dict[str, Any]:
+        """Check if Ollama is running and which models are available.
+
+        A result younger than max_age_sec is reused instead of probing again.
+        """
+        if self._last_health is not None and time.monotonic() - self._last_health_at < max_age_sec:
+            return self._last_health
+        self._last_health = await self._probe_health()
+        self._last_health_at = time.monotonic()
+        return self._last_health
+
+    async def _probe_health(self) -> Dict[str, Any]:
         try:
             async with httpx.AsyncClient(timeout=3.0) as client:
                 resp = await client.get(f"{self.host}/api/tags")
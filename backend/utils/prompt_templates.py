@@ -5,6 +5,34 @@ Builds age-appropriate prompts compiled from Orchestrator modifiers.
 From spec's Teaching Specialist prompt template.
 """
 
+from typing import Dict
+
+
+# Vocabulary ceiling mapping
+VOCAB_CEILINGS: Dict[str, str] = {
+    "simplified": "kindergarten (very simple words only)",
+    "standard": "grade 3 (common everyday words)",
+    "advanced": "grade 5 (some complex words allowed)",
+}
+
+# Mood-specific additions (moods not listed get no extra instructions)
+MOOD_INSTRUCTIONS: Dict[str, str] = {
+    "frustrated": (
+        "- The child seems frustrated. Be extra patient and encouraging.\n"
+        "- Start with something they already know to rebuild confidence.\n"
+        "- Use lots of praise and positive reinforcement.\n"
+    ),
+    "tired": (
+        "- The child seems tired. Keep it very short and fun.\n"
+        "- Use stories or fun facts instead of direct teaching.\n"
+        "- Suggest taking a break if appropriate.\n"
+    ),
+    "happy": (
+        "- The child is engaged and happy! Challenge them a little.\n"
+        "- Ask a fun question to keep their curiosity going.\n"
+    ),
+}
+
 
 def build_teaching_prompt(
     topic: str,
@@ -17,33 +45,9 @@ def build_teaching_prompt(
 ) -> str:
     """Build a dynamic teaching prompt with all modifiers injected."""
 
-    # Vocabulary ceiling mapping
-    vocab_ceilings = {
-        "simplified": "kindergarten (very simple words only)",
-        "standard": "grade 3 (common everyday words)",
-        "advanced": "grade 5 (some complex words allowed)",
-    }
-    vocabulary_ceiling = vocab_ceilings.get(vocabulary_level, vocab_ceilings["standard"])
+    vocabulary_ceiling = VOCAB_CEILINGS.get(vocabulary_level, VOCAB_CEILINGS["standard"])
 
-    # Mood-specific additions
-    mood_instructions = ""
-    if mood == "frustrated":
-        mood_instructions = (
-            "- The child seems frustrated. Be extra patient and encouraging.\n"
-            "- Start with something they already know to rebuild confidence.\n"
-            "- Use lots of praise and positive reinforcement.\n"
-        )
-    elif mood == "tired":
-        mood_instructions = (
-            "- The child seems tired. Keep it very short and fun.\n"
-            "- Use stories or fun facts instead of direct teaching.\n"
-            "- Suggest taking a break if appropriate.\n"
-        )
-    elif mood == "happy":
-        mood_instructions = (
-            "- The child is engaged and happy! Challenge them a little.\n"
-            "- Ask a fun question to keep their curiosity going.\n"
-        )
+    mood_instructions = MOOD_INSTRUCTIONS.get(mood, "")
 
     prompt = f"""You are teaching a {age}-year-old at {academic_tier} level.
 Current mood: {mood}
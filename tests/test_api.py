@@ -10,7 +10,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import pytest
 from fastapi.testclient import TestClient
-from backend.main import app
+from backend.main import app, vector_store
 
 
 client = TestClient(app)
@@ -79,6 +79,37 @@ def test_recommend():
     assert "reason" in data
 
 
+def test_recommend_uses_latest_telemetry():
+    """Recommendation follows the engagement from the latest telemetry."""
+    start = client.post("/api/v1/session/start", json={
+        "child_id": "test-child-005"
+    }).json()
+
+    # A stored behaviour that matches the "engagement" vector query exactly
+    vector_store.store_behavior(
+        "test-child-005", "engagement", "engagement", metadata={"engagement_score": 90}
+    )
+
+    client.post("/api/v1/telemetry", json={
+        "child_id": "test-child-005",
+        "session_id": start["session_id"],
+        "tap_latency_ms": 600,
+        "back_button_count": 5,
+        "scroll_speed": "fast",
+        "time_on_task_sec": 120,
+        "error_rate": 0.5
+    })
+
+    resp = client.post("/api/v1/recommend", json={
+        "child_id": "test-child-005",
+        "current_topic": "planets"
+    })
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["recommended_topic"] == "planets"
+    assert data["difficulty_level"] == 1
+
+
 def test_session_end():
     """End a session and get next recommendation."""
     start = client.post("/api/v1/session/start", json={
@@ -95,6 +126,7 @@ def test_session_end():
     data = resp.json()
     assert data["profile_updated"] is True
     assert "next_recommendation" in data
+    assert data["streak_days"] >= 1
 
 
 def test_full_session_lifecycle():
@@ -142,6 +174,7 @@ if __name__ == "__main__":
     test_session_start()
     test_telemetry()
     test_recommend()
+    test_recommend_uses_latest_telemetry()
     test_session_end()
     test_full_session_lifecycle()
     print("✅ All API tests passed!")
@@ -89,9 +89,25 @@ def test_anti_echo_chamber():
     assert "growth" in results[3]["reason"].lower() or "challenge" in results[3]["reason"].lower()
 
 
+def test_interest_based_recommendation():
+    """Strong stored interest → next topic from the interest's graph entry."""
+    agent, db, vs = _make_agent()
+    db.get_or_create_profile("kid-rec-5")
+    vs.store_topic_interests("kid-rec-5", ["animals", "animals"], 90)
+
+    result = agent.suggest(
+        child_id="kid-rec-5",
+        current_topic="",
+        engagement_score=60,
+    )
+    assert result["recommended_topic"] == "habitats"
+    assert "interest" in result["reason"].lower()
+
+
 if __name__ == "__main__":
     test_low_engagement_simplifies()
     test_high_engagement_advances()
     test_new_child_gets_default()
     test_anti_echo_chamber()
+    test_interest_based_recommendation()
     print("All Recommender Agent tests passed!")